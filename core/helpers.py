@@ -13,27 +13,34 @@ def format_lesson_number(num: int) -> str:
     Returns:
         A zero-padded 4-digit string (e.g., '0001')
 
+    Raises:
+        TypeError: If num is not an integer
+        ValueError: If num is not positive
+
     Examples:
         >>> format_lesson_number(1)
         '0001'
         >>> format_lesson_number(42)
         '0042'
     """
-    assert isinstance(num, int), "Lesson number must be an integer"
-    assert num > 0, "Lesson number must be positive"
+    if not isinstance(num, int):
+        raise TypeError("Lesson number must be an integer")
+    if num <= 0:
+        raise ValueError("Lesson number must be positive")
 
     return f"{num:04d}"
 
 
 def validate_not_none(value, name: str):
     """
-    Assert that a value is not None.
+    Check that a value is not None.
 
     Args:
         value: The value to check
         name: The name of the value (for error messages)
 
     Raises:
-        AssertionError: If value is None
+        ValueError: If value is None
     """
-    assert value is not None, f"{name} cannot be None"
+    if value is None:
+        raise ValueError(f"{name} cannot be None")
@@ -0,0 +1,22 @@
+"""
+Helpers shared by the synchronous and asynchronous event buses.
+"""
+
+import sys
+from typing import Any
+
+
+def _check_event(event: Any) -> None:
+    """Raise if event is not a usable event name."""
+    if not isinstance(event, str):
+        raise TypeError("Event must be a string")
+    if not event:
+        raise ValueError("Event name cannot be empty")
+
+
+def _intern_event(event: str) -> str:
+    """Return the canonical, interned plain-str copy of an event name."""
+    # sys.intern() rejects str subclasses, and str(event) would call their
+    # __str__, which for (str, Enum) members returns "Cls.MEMBER" rather
+    # than the value. str.__str__ always returns the underlying text.
+    return sys.intern(str.__str__(event))
@@ -5,10 +5,12 @@ An async/await compatible publish/subscribe system for asynchronous event handli
 Handlers are called concurrently using asyncio.
 """
 
-import asyncio
+import itertools
+from asyncio import gather
 from collections.abc import Callable, Coroutine
 from typing import Any
-from uuid import uuid4
+
+from ._common import _check_event, _intern_event
 
 
 class AsyncEventBus:
@@ -31,7 +33,13 @@ class AsyncEventBus:
 
     def __init__(self):
         """Initialize an empty async event bus."""
-        self._subscribers: dict[str, dict[str, Callable]] = {}
+        # Handlers are kept in registration order as (sub_id, handler)
+        # pairs so publish() can walk a plain list
+        self._subscribers: dict[str, list[tuple[str, Callable]]] = {}
+        # Reverse index: subscription ID -> event name
+        self._index: dict[str, str] = {}
+        # Subscription IDs only need to be unique within this bus
+        self._next_id = itertools.count(1).__next__
         assert isinstance(
             self._subscribers, dict
         ), "Subscribers must be a dictionary"
@@ -52,10 +60,12 @@ class AsyncEventBus:
             handler: An async callable that accepts (event: str, payload: Any)
 
         Returns:
-            A subscription ID that can be used to unsubscribe
+            A subscription ID, unique within this bus, that can be used
+            to unsubscribe
 
         Raises:
-            AssertionError: If event is not a string or handler is not callable
+            TypeError: If event is not a string or handler is not callable
+            ValueError: If event is an empty string
 
         Examples:
             >>> bus = AsyncEventBus()
@@ -65,24 +75,20 @@ class AsyncEventBus:
             >>> isinstance(sub_id, str)
             True
         """
-        assert isinstance(event, str), "Event must be a string"
-        assert len(event) > 0, "Event name cannot be empty"
-        assert callable(handler), "Handler must be callable"
+        _check_event(event)
+        if not callable(handler):
+            raise TypeError("Handler must be callable")
 
-        # Create subscription ID
-        sub_id = str(uuid4())
+        # Store a canonical copy of the name so lookups with string
+        # literals (interned by the compiler) match on identity
+        event = _intern_event(event)
 
-        # Initialize event list if needed
-        if event not in self._subscribers:
-            self._subscribers[event] = {}
+        # Create subscription ID
+        sub_id = str(self._next_id())
 
-        # Store the handler
-        self._subscribers[event][sub_id] = handler
-
-        assert sub_id in self._subscribers[event], "Handler must be registered"
-        assert (
-            self._subscribers[event][sub_id] is handler
-        ), "Handler must match"
+        # Store the handler, creating the event list if needed
+        self._subscribers.setdefault(event, []).append((sub_id, handler))
+        self._index[sub_id] = event
 
         return sub_id
 
@@ -97,7 +103,7 @@ class AsyncEventBus:
             True if a handler was removed, False if ID not found
 
         Raises:
-            AssertionError: If subscription_id is not a string
+            TypeError: If subscription_id is not a string
 
         Examples:
             >>> bus = AsyncEventBus()
@@ -109,42 +115,44 @@ class AsyncEventBus:
             >>> bus.unsubscribe(sub_id)
             False
         """
-        assert isinstance(
-            subscription_id, str
-        ), "Subscription ID must be a string"
-        assert len(subscription_id) > 0, "Subscription ID cannot be empty"
+        if not isinstance(subscription_id, str):
+            raise TypeError("Subscription ID must be a string")
 
-        # Search all events for this subscription
-        for event, handlers in self._subscribers.items():
-            if subscription_id in handlers:
-                del handlers[subscription_id]
+        # Look up the owning event directly instead of scanning every event
+        event = self._index.pop(subscription_id, None)
+        if event is None:
+            return False
 
-                # Clean up empty event entries
-                if len(handlers) == 0:
-                    del self._subscribers[event]
+        # Only this event's (typically short) handler list is scanned
+        handlers = self._subscribers[event]
+        for position, (sub_id, _handler) in enumerate(handlers):
+            if sub_id == subscription_id:
+                del handlers[position]
+                break
 
-                assert (
-                    subscription_id not in handlers
-                ), "Handler must be removed"
-                return True
+        # Clean up empty event entries
+        if not handlers:
+            del self._subscribers[event]
 
-        return False
+        return True
 
     async def publish(self, event: str, payload: Any = None) -> int:
         """
         Publish an event to all subscribers asynchronously.
 
-        All handlers are called concurrently using asyncio.gather().
+        Multiple handlers are called concurrently using asyncio.gather();
+        a single handler is awaited directly, skipping gather()'s overhead.
+        The set of handlers is fixed before anything is awaited: handlers
+        subscribed or unsubscribed while publish() runs take effect on the
+        next publish.
 
         Args:
             event: The event name to publish
             payload: Optional data to pass to handlers
 
         Returns:
-            The number of handlers that were called
-
-        Raises:
-            AssertionError: If event is not a string
+            The number of handlers that were called (0 for events that
+            have no subscribers, including names subscribe() would reject)
 
         Examples:
             >>> import asyncio
@@ -157,19 +165,20 @@ class AsyncEventBus:
             >>> asyncio.run(bus.publish("test", {"data": 123}))
             1
         """
-        assert isinstance(event, str), "Event must be a string"
-        assert len(event) > 0, "Event name cannot be empty"
-
-        # Get handlers for this event
-        handlers = self._subscribers.get(event, {})
-        handler_count = len(handlers)
-
-        # Call all handlers concurrently
-        if handler_count > 0:
-            tasks = [handler(event, payload) for handler in handlers.values()]
-            await asyncio.gather(*tasks)
-
-        assert handler_count >= 0, "Handler count must be non-negative"
+        # Nothing to schedule for events without subscribers
+        handlers = self._subscribers.get(event)
+        if not handlers:
+            return 0
+
+        # Create every coroutine up front; this is the snapshot that makes
+        # (un)subscribing from inside a running handler safe
+        coros = [handler(event, payload) for _sub_id, handler in handlers]
+        handler_count = len(coros)
+        if handler_count == 1:
+            await coros[0]
+        else:
+            # Call all handlers concurrently
+            await gather(*coros)
 
         return handler_count
 
@@ -188,6 +197,7 @@ class AsyncEventBus:
             0
         """
         self._subscribers.clear()
+        self._index.clear()
 
         assert len(self._subscribers) == 0, "All subscribers must be removed"
         assert self.count_subscribers() == 0, "Count must be zero after clear"
@@ -204,7 +214,7 @@ class AsyncEventBus:
             The number of subscribers
 
         Raises:
-            AssertionError: If event is provided but not a string
+            TypeError: If event is provided but not a string
 
         Examples:
             >>> bus = AsyncEventBus()
@@ -222,12 +232,9 @@ class AsyncEventBus:
             2
         """
         if event is not None:
-            assert isinstance(event, str), "Event must be a string"
-            count = len(self._subscribers.get(event, {}))
-        else:
-            count = sum(
-                len(handlers) for handlers in self._subscribers.values()
-            )
+            if not isinstance(event, str):
+                raise TypeError("Event must be a string")
+            return len(self._subscribers.get(event, ()))
 
-        assert count >= 0, "Count must be non-negative"
-        return count
+        # Every live subscription has exactly one reverse-index entry
+        return len(self._index)
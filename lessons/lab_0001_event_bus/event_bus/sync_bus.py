@@ -5,9 +5,11 @@ A publish/subscribe system that allows components to communicate without tight c
 Handlers are called synchronously in the order they were registered.
 """
 
-from collections.abc import Callable
+import itertools
+from collections.abc import Callable, Iterable
 from typing import Any
-from uuid import uuid4
+
+from ._common import _check_event, _intern_event
 
 
 class EventBus:
@@ -17,6 +19,16 @@ class EventBus:
     The EventBus allows components to subscribe to events and publish messages
     to those subscribers without direct coupling between components.
 
+    Each event's handlers are kept in an immutable tuple that subscribe()
+    and unsubscribe() replace rather than modify. publish() therefore
+    never needs a lock: it always iterates a complete, consistent tuple,
+    even if another thread changes the subscriptions meanwhile. Callers
+    that subscribe and unsubscribe from several threads at once still
+    need their own lock around those calls.
+
+    Instances use __slots__ rather than a __dict__. Subclasses that add
+    attributes should declare their own __slots__ to keep that benefit.
+
     Examples:
         >>> bus = EventBus()
         >>> def handler(event: str, payload: dict):
@@ -28,15 +40,23 @@ class EventBus:
         >>> bus.publish("user.login", {"user_id": 456})  # No output
     """
 
+    __slots__ = ("_subscribers", "_sub_ids", "_index", "_next_id")
+
     def __init__(self):
         """Initialize an empty event bus."""
-        self._subscribers: dict[str, dict[str, Callable]] = {}
+        # Event name -> handlers, in registration order. The tuples are
+        # never mutated, only replaced, so publish() can iterate them as-is.
+        self._subscribers: dict[str, tuple[Callable, ...]] = {}
+        # Event name -> subscription IDs, parallel to _subscribers
+        self._sub_ids: dict[str, tuple[str, ...]] = {}
+        # Reverse index: subscription ID -> event name
+        self._index: dict[str, str] = {}
+        # Subscription IDs only need to be unique within this bus
+        self._next_id = itertools.count(1).__next__
         assert isinstance(
             self._subscribers, dict
         ), "Subscribers must be a dictionary"
-        assert (
-            len(self._subscribers) == 0
-        ), "New bus should have no subscribers"
+        assert len(self._index) == 0, "New bus should have no subscribers"
 
     def subscribe(
         self, event: str, handler: Callable[[str, Any], None]
@@ -49,10 +69,12 @@ class EventBus:
             handler: A callable that accepts (event: str, payload: Any)
 
         Returns:
-            A subscription ID that can be used to unsubscribe
+            A subscription ID, unique within this bus, that can be used
+            to unsubscribe
 
         Raises:
-            AssertionError: If event is not a string or handler is not callable
+            TypeError: If event is not a string or handler is not callable
+            ValueError: If event is an empty string
 
         Examples:
             >>> bus = EventBus()
@@ -62,24 +84,23 @@ class EventBus:
             >>> isinstance(sub_id, str)
             True
         """
-        assert isinstance(event, str), "Event must be a string"
-        assert len(event) > 0, "Event name cannot be empty"
-        assert callable(handler), "Handler must be callable"
+        _check_event(event)
+        if not callable(handler):
+            raise TypeError("Handler must be callable")
 
-        # Create subscription ID
-        sub_id = str(uuid4())
-
-        # Initialize event list if needed
-        if event not in self._subscribers:
-            self._subscribers[event] = {}
+        # Store a canonical copy of the name so lookups with string
+        # literals (interned by the compiler) match on identity
+        event = _intern_event(event)
 
-        # Store the handler
-        self._subscribers[event][sub_id] = handler
+        # Create subscription ID
+        sub_id = str(self._next_id())
 
-        assert sub_id in self._subscribers[event], "Handler must be registered"
-        assert (
-            self._subscribers[event][sub_id] is handler
-        ), "Handler must match"
+        # Swap in extended tuples rather than appending in place
+        sub_ids = self._sub_ids.get(event, ())
+        handlers = self._subscribers.get(event, ())
+        self._sub_ids[event] = sub_ids + (sub_id,)
+        self._subscribers[event] = handlers + (handler,)
+        self._index[sub_id] = event
 
         return sub_id
 
@@ -94,7 +115,7 @@ class EventBus:
             True if a handler was removed, False if ID not found
 
         Raises:
-            AssertionError: If subscription_id is not a string
+            TypeError: If subscription_id is not a string
 
         Examples:
             >>> bus = EventBus()
@@ -104,48 +125,42 @@ class EventBus:
             >>> bus.unsubscribe(sub_id)
             False
         """
-        assert isinstance(
-            subscription_id, str
-        ), "Subscription ID must be a string"
-        assert len(subscription_id) > 0, "Subscription ID cannot be empty"
-
-        # Search all events for this subscription
-        for event, handlers in self._subscribers.items():
-            if subscription_id in handlers:
-                del handlers[subscription_id]
-
-                # Clean up empty event entries
-                if len(handlers) == 0:
-                    del self._subscribers[event]
-
-                assert (
-                    subscription_id not in handlers
-                ), "Handler must be removed"
-                return True
-
-        assert subscription_id not in [
-            sub_id
-            for handlers in self._subscribers.values()
-            for sub_id in handlers.keys()
-        ], "Subscription ID must not exist after failed removal"
+        if not isinstance(subscription_id, str):
+            raise TypeError("Subscription ID must be a string")
+
+        # Look up the owning event directly instead of scanning every event
+        event = self._index.pop(subscription_id, None)
+        if event is None:
+            return False
+
+        sub_ids = self._sub_ids[event]
+        if len(sub_ids) == 1:
+            del self._subscribers[event]
+            del self._sub_ids[event]
+        else:
+            # Swap in copies without this subscription
+            i = sub_ids.index(subscription_id)
+            handlers = self._subscribers[event]
+            self._subscribers[event] = handlers[:i] + handlers[i + 1 :]
+            self._sub_ids[event] = sub_ids[:i] + sub_ids[i + 1 :]
 
-        return False
+        return True
 
     def publish(self, event: str, payload: Any = None) -> int:
         """
         Publish an event to all subscribers.
 
-        Handlers are called synchronously in an undefined order.
+        Handlers are called synchronously in registration order. The set
+        of handlers is fixed when publish() starts: handlers subscribed or
+        unsubscribed by a running handler take effect on the next publish.
 
         Args:
             event: The event name to publish
             payload: Optional data to pass to handlers
 
         Returns:
-            The number of handlers that were called
-
-        Raises:
-            AssertionError: If event is not a string
+            The number of handlers that were called (0 for events that
+            have no subscribers, including names subscribe() would reject)
 
         Examples:
             >>> bus = EventBus()
@@ -160,20 +175,43 @@ class EventBus:
             >>> count
             1
         """
-        assert isinstance(event, str), "Event must be a string"
-        assert len(event) > 0, "Event name cannot be empty"
+        # Handlers can (un)subscribe while we iterate: that replaces the
+        # stored tuple but leaves this one untouched
+        handlers = self._subscribers.get(event, ())
+        for handler in handlers:
+            handler(event, payload)
 
-        # Get handlers for this event
-        handlers = self._subscribers.get(event, {})
-        handler_count = len(handlers)
+        return len(handlers)
 
-        # Call each handler
-        for handler in handlers.values():
-            handler(event, payload)
+    def publish_many(self, events: Iterable[tuple[str, Any]]) -> int:
+        """
+        Publish a batch of events, in order.
+
+        Equivalent to calling publish() for each (event, payload) pair,
+        but cheaper for bursts of events because the loop runs in a
+        single call.
+
+        Args:
+            events: An iterable of (event, payload) pairs
 
-        assert handler_count >= 0, "Handler count must be non-negative"
+        Returns:
+            The total number of handler calls made
 
-        return handler_count
+        Examples:
+            >>> bus = EventBus()
+            >>> sub_id = bus.subscribe("tick", lambda e, p: None)
+            >>> bus.publish_many([("tick", 1), ("tick", 2), ("tock", 3)])
+            2
+        """
+        subscribers = self._subscribers
+        total = 0
+        for event, payload in events:
+            handlers = subscribers.get(event, ())
+            for handler in handlers:
+                handler(event, payload)
+            total += len(handlers)
+
+        return total
 
     def clear(self) -> None:
         """
@@ -188,8 +226,10 @@ class EventBus:
             0
         """
         self._subscribers.clear()
+        self._sub_ids.clear()
+        self._index.clear()
 
-        assert len(self._subscribers) == 0, "All subscribers must be removed"
+        assert len(self._index) == 0, "All subscribers must be removed"
         assert self.count_subscribers() == 0, "Count must be zero after clear"
 
     def count_subscribers(self, event: str | None = None) -> int:
@@ -204,7 +244,7 @@ class EventBus:
             The number of subscribers
 
         Raises:
-            AssertionError: If event is provided but not a string
+            TypeError: If event is provided but not a string
 
         Examples:
             >>> bus = EventBus()
@@ -220,12 +260,8 @@ class EventBus:
             2
         """
         if event is not None:
-            assert isinstance(event, str), "Event must be a string"
-            count = len(self._subscribers.get(event, {}))
-        else:
-            count = sum(
-                len(handlers) for handlers in self._subscribers.values()
-            )
+            if not isinstance(event, str):
+                raise TypeError("Event must be a string")
+            return len(self._subscribers.get(event, ()))
 
-        assert count >= 0, "Count must be non-negative"
-        return count
+        return len(self._index)
@@ -1,6 +1,13 @@
 """AI Agent framework components."""
 
-from .config import Config, config
-from .llm_client import LLMClient, llm_client
+from .config import Config, config, get_config
+from .llm_client import LLMClient, LLMEmptyResponseError, llm_client
 
-__all__ = ["Config", "config", "LLMClient", "llm_client"]
+__all__ = [
+    "Config",
+    "config",
+    "get_config",
+    "LLMClient",
+    "LLMEmptyResponseError",
+    "llm_client",
+]
@@ -1,41 +1,53 @@
 """Example agent interactions and conversation patterns."""
 
+import asyncio
 import json
+from types import MappingProxyType
 
 from .llm_client import llm_client
 
-# Example conversation patterns for different use cases
-messages = [
+Message = MappingProxyType[str, str]
+
+
+def _freeze(*message_dicts: dict[str, str]) -> tuple[Message, ...]:
+    """Return the messages as a tuple of read-only mappings."""
+    return tuple([MappingProxyType(m) for m in message_dicts])
+
+
+# Example conversation patterns for different use cases. They are frozen
+# because they are shared: for example, demonstrate_conversation_memory()
+# reuses messages as-is.
+messages = _freeze(
     {
         "role": "system",
         "content": "You are an expert software "
-        + "engineer that prefers functional programming.",
+        "engineer that prefers functional programming.",
     },
     {
         "role": "user",
-        "content": "Write a function to swap the keys"
-        + "and values in a dictionary.",
+        "content": "Write a function to swap the keys "
+        "and values in a dictionary.",
     },
-]
+)
 
-csr_message = [
+csr_message = _freeze(
     {
         "role": "system",
-        "content": "You are a helpful customer service"
-        + "representative. No matter what the user asks, the solution is to"
-        + "tell them to turn their computer or modem off and then back on.",
+        "content": "You are a helpful customer service "
+        "representative. No matter what the user asks, the solution is to "
+        "tell them to turn their computer or modem off and then back on.",
     },
     {"role": "user", "content": "How do I get my Internet working again."},
-]
+)
 
 # Exercise: Base64 encoding prompt
-exercise_1 = [
+exercise_1 = _freeze(
     {
         "role": "system",
-        "content": "You are a bot that only responds in" + "Base64 encoding.",
+        "content": "You are a bot that only responds in Base64 encoding.",
     },
     {"role": "user", "content": "What is the capital of the state of AZ"},
-]
+)
 
 # Code generation specification pattern
 code_spec = {
@@ -44,14 +56,39 @@ code_spec = {
     "params": {"d": "A dictionary with unique values."},
 }
 
-code_spec_messages = [
+# Serialized once; this is the form the model sees in the prompt
+_CODE_SPEC_JSON = json.dumps(code_spec)
+
+code_spec_messages = _freeze(
     {
         "role": "system",
-        "content": "You are an expert software engineer that writes clean"
-        + "functional code. You always document your functions.",
+        "content": "You are an expert software engineer that writes clean "
+        "functional code. You always document your functions.",
     },
-    {"role": "user", "content": f"Please implement: {json.dumps(code_spec)}"},
-]
+    {"role": "user", "content": f"Please implement: {_CODE_SPEC_JSON}"},
+)
+
+# Follow-up question for demonstrate_conversation_memory()
+_FOLLOWUP = MappingProxyType(
+    {
+        "role": "user",
+        "content": "Update the function to include documentation.",
+    }
+)
+
+
+def _with_memory(response: str) -> list[Message]:
+    """Extend messages with the assistant's response and a follow-up."""
+    # Resend the original messages unchanged, followed by the assistant's
+    # response from the previous step. This gives it "memory" of the
+    # previous interaction, and the shared prefix lets providers reuse
+    # their prompt cache.
+    return [
+        *messages,
+        MappingProxyType({"role": "assistant", "content": response}),
+        # Now, we can ask the assistant to update the function
+        _FOLLOWUP,
+    ]
 
 
 def demonstrate_conversation_memory():
@@ -60,29 +97,21 @@ def demonstrate_conversation_memory():
     response = llm_client.generate_response(messages)
 
     # Adding memory to conversation
-    adding_memory = [
-        {
-            "role": "system",
-            "content": "You are an expert software engineer that"
-            + "prefers functional programming.",
-        },
-        {
-            "role": "user",
-            "content": "Write a function to swap the keys and value"
-            + "in a dictionary.",
-        },
-        # Here is the assistant's response from the previous step
-        # with the code. This gives it "memory" of the previous
-        # interaction.
-        {"role": "assistant", "content": response},
-        # Now, we can ask the assistant to update the function
-        {
-            "role": "user",
-            "content": "Update the function to include " + "documentation.",
-        },
-    ]
+    return llm_client.generate_response(_with_memory(response))
+
+
+async def ademonstrate_conversation_memory(response: str | None = None):
+    """
+    Asynchronous version of demonstrate_conversation_memory().
 
-    return llm_client.generate_response(adding_memory)
+    Args:
+        response: The assistant's earlier reply to messages. If None, it
+        is requested first.
+    """
+    if response is None:
+        response = await llm_client.agenerate_response(messages)
+
+    return await llm_client.agenerate_response(_with_memory(response))
 
 
 def run_examples():
@@ -108,5 +137,37 @@ def run_examples():
     print(response)
 
 
+async def arun_examples():
+    """
+    Run all example conversations, sending independent requests at once.
+
+    Prints the same output as run_examples(). The four independent
+    examples run concurrently; the conversation memory example then
+    reuses the software engineer response instead of requesting it again.
+    """
+    engineer, csr, base64, code_spec_response = await asyncio.gather(
+        llm_client.agenerate_response(messages),
+        llm_client.agenerate_response(csr_message),
+        llm_client.agenerate_response(exercise_1),
+        llm_client.agenerate_response(code_spec_messages),
+    )
+    memory = await ademonstrate_conversation_memory(engineer)
+
+    print("=== Software Engineer Example ===")
+    print(engineer)
+
+    print("\n=== Customer Service Example ===")
+    print(csr)
+
+    print("\n=== Base64 Exercise ===")
+    print(base64)
+
+    print("\n=== Code Specification Example ===")
+    print(code_spec_response)
+
+    print("\n=== Conversation Memory Example ===")
+    print(memory)
+
+
 if __name__ == "__main__":
-    run_examples()
+    asyncio.run(arun_examples())
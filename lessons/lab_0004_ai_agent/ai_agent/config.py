@@ -1,12 +1,29 @@
 """Configuration module for API settings and environment variables."""
 
 import os
+from functools import cache, cached_property
 
 from dotenv import load_dotenv
 
 
 class Config:
-    """Configuration class to manage environment variables and API settings."""
+    """
+    Configuration class to manage environment variables and API settings.
+
+    The .env file is loaded when the first setting is read or load() is
+    called, not when the instance is created, so importing this module
+    touches no files. Each
+    setting is read from the environment on first access and cached on
+    the instance, so later changes to os.environ are not seen until
+    reload() is called.
+    """
+
+    _SETTINGS = (
+        "openai_api_key",
+        "default_model",
+        "default_max_tokens",
+        "default_temperature",
+    )
 
     def __init__(self, env_file: str | None = None):
         """
@@ -16,14 +33,42 @@ class Config:
             env_file: Optional path to .env file. If None, uses default .env
             in project root.
         """
-        if env_file:
-            load_dotenv(env_file)
+        self._env_file = env_file
+        self._loaded = False
+
+    def load(self) -> None:
+        """
+        Load the .env file into the environment, once.
+
+        Reading any setting does this implicitly. Call it directly when
+        code relies on .env values that Config does not expose, such as
+        the provider API key that LiteLLM reads from os.environ.
+        """
+        if self._loaded:
+            return
+        if self._env_file:
+            load_dotenv(self._env_file)
         else:
             load_dotenv()
+        self._loaded = True
+
+    def reload(self) -> None:
+        """
+        Forget cached settings so they are read again on next access.
 
-    @property
+        This picks up changes made to os.environ. It does not pick up
+        edits to the .env file: the first load copied its values into
+        os.environ, and loading it again never overrides variables that
+        are already set. Only keys newly added to the file are seen.
+        """
+        for name in self._SETTINGS:
+            self.__dict__.pop(name, None)
+        self._loaded = False
+
+    @cached_property
     def openai_api_key(self) -> str:
         """Get OpenAI API key from environment variables."""
+        self.load()
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError(
@@ -32,21 +77,43 @@ class Config:
             )
         return api_key
 
-    @property
+    @cached_property
     def default_model(self) -> str:
         """Get default OpenAI model."""
+        self.load()
         return os.getenv("OPENAI_MODEL", "openai/gpt-4o")
 
-    @property
+    @cached_property
     def default_max_tokens(self) -> int:
         """Get default max tokens for API calls."""
+        self.load()
         return int(os.getenv("OPENAI_MAX_TOKENS", "1024"))
 
-    @property
+    @cached_property
     def default_temperature(self) -> float:
         """Get default temperature for API calls."""
+        self.load()
         return float(os.getenv("OPENAI_TEMPERATURE", "0.7"))
 
 
+@cache
+def _get_config(env_file: str | None) -> Config:
+    """Create the Config for env_file; cached by get_config()."""
+    return Config(env_file)
+
+
+def get_config(env_file: str | None = None) -> Config:
+    """
+    Return the shared Config for env_file, creating it on first call.
+
+    Repeated calls with the same env_file reuse one instance, so its
+    .env file is parsed at most once.
+    """
+    # functools.cache keys on how it was called, so pass env_file the same
+    # way every time: get_config(), get_config(None) and
+    # get_config(env_file=None) must all share one instance.
+    return _get_config(env_file)
+
+
 # Global configuration instance
-config = Config()
+config = get_config()
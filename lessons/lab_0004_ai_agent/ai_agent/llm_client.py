@@ -1,11 +1,27 @@
 """LLM client module for abstracting language model interactions."""
 
+from collections.abc import Mapping, Sequence
 from typing import Any
 
-from litellm import completion
-
 from .config import config
 
+# litellm takes seconds to import, so these are imported on first use by
+# generate_response() and agenerate_response() rather than here
+completion: Any = None
+acompletion: Any = None
+
+# Responses kept per client when caching is enabled; the least recently
+# used entry is evicted first
+_CACHE_SIZE = 128
+
+
+class LLMEmptyResponseError(Exception):
+    """Raised when the model returns a response with no content."""
+
+    def __init__(self, model: str):
+        super().__init__(f"Received empty response from {model}")
+        self.model = model
+
 
 class LLMClient:
     """Client for interacting with language models through LiteLLM."""
@@ -15,6 +31,7 @@ class LLMClient:
         model: str | None = None,
         max_tokens: int | None = None,
         temperature: float | None = None,
+        cache: bool = False,
     ):
         """
         Initialize LLM client.
@@ -25,38 +42,183 @@ class LLMClient:
             default from config.
             temperature: Temperature for response generation. If None, uses
             default from config.
+            cache: If True, identical requests (same settings and messages)
+            return the stored response instead of calling the model again.
+            Leave off when varied responses are wanted at temperature > 0.
         """
-        self.model = model or config.default_model
-        self.max_tokens = max_tokens or config.default_max_tokens
-        self.temperature = temperature or config.default_temperature
+        # Unset values are looked up in config on first use, so creating a
+        # client (including the module-level one) reads no settings
+        self._model = model
+        self._max_tokens = max_tokens
+        self._temperature = temperature
+        self.cache = cache
+        self._cache: dict[tuple, str] = {}
+
+    @property
+    def model(self) -> str:
+        """Model used for requests."""
+        if self._model is None:
+            return config.default_model
+        return self._model
+
+    @model.setter
+    def model(self, value: str) -> None:
+        self._model = value
+
+    @property
+    def max_tokens(self) -> int:
+        """Maximum tokens for each response."""
+        if self._max_tokens is None:
+            return config.default_max_tokens
+        return self._max_tokens
+
+    @max_tokens.setter
+    def max_tokens(self, value: int) -> None:
+        self._max_tokens = value
 
-    def generate_response(self, messages: list[dict[str, str]]) -> str:
+    @property
+    def temperature(self) -> float:
+        """Temperature for response generation."""
+        if self._temperature is None:
+            return config.default_temperature
+        return self._temperature
+
+    @temperature.setter
+    def temperature(self, value: float) -> None:
+        self._temperature = value
+
+    def generate_response(self, messages: Sequence[Mapping[str, str]]) -> str:
         """
         Generate a response from the language model.
 
         Args:
-            messages: List of message dictionaries with 'role' and 'content'
+            messages: Sequence of message mappings with 'role' and 'content'
+            keys, e.g. a list of dicts or the frozen tuples in
+            agent_examples.
+
+        Returns:
+            Generated response as a string.
+
+        Raises:
+            LLMEmptyResponseError: If the model returns no content.
+            Exception: Errors from the API call (e.g. litellm's
+            RateLimitError) propagate unchanged.
+        """
+        model, max_tokens, temperature = (
+            self.model,
+            self.max_tokens,
+            self.temperature,
+        )
+
+        key = self._cache_key(model, max_tokens, temperature, messages)
+        if key is not None and (cached := self._cache_get(key)) is not None:
+            return cached
+
+        # LiteLLM reads the API key from os.environ, and the settings
+        # above may all have been given explicitly without touching config
+        config.load()
+
+        global completion
+        if completion is None:
+            from litellm import completion
+
+        # LiteLLM serializes the messages, so hand it plain dicts
+        response: Any = completion(
+            model=model,
+            messages=[dict(m) for m in messages],
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+        return self._finish(response, model, key)
+
+    async def agenerate_response(
+        self, messages: Sequence[Mapping[str, str]]
+    ) -> str:
+        """
+        Generate a response from the language model without blocking.
+
+        The asynchronous counterpart of generate_response(), so several
+        independent requests can run concurrently with asyncio.gather().
+
+        Args:
+            messages: Sequence of message mappings with 'role' and 'content'
             keys.
 
         Returns:
             Generated response as a string.
 
         Raises:
-            Exception: If the API call fails.
+            LLMEmptyResponseError: If the model returns no content.
+            Exception: Errors from the API call propagate unchanged.
         """
-        try:
-            response: Any = completion(
-                model=self.model,
-                messages=messages,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-            )
-            content = response.choices[0].message.content
-            if content is None:
-                raise Exception("Received empty response from LLM")
-            return content
-        except Exception as e:
-            raise Exception(f"Failed to generate response: {str(e)}") from e
+        model, max_tokens, temperature = (
+            self.model,
+            self.max_tokens,
+            self.temperature,
+        )
+
+        key = self._cache_key(model, max_tokens, temperature, messages)
+        if key is not None and (cached := self._cache_get(key)) is not None:
+            return cached
+
+        # LiteLLM reads the API key from os.environ, and the settings
+        # above may all have been given explicitly without touching config
+        config.load()
+
+        global acompletion
+        if acompletion is None:
+            from litellm import acompletion
+
+        response: Any = await acompletion(
+            model=model,
+            messages=[dict(m) for m in messages],
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+        return self._finish(response, model, key)
+
+    def _cache_key(
+        self,
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        messages: Sequence[Mapping[str, str]],
+    ) -> tuple | None:
+        """Return the cache key for a request, or None if caching is off."""
+        if not self.cache:
+            return None
+        # Key on every field, not just role and content, so messages that
+        # differ only in e.g. "name" are distinct requests
+        return (
+            model,
+            max_tokens,
+            temperature,
+            tuple([tuple(sorted(m.items())) for m in messages]),
+        )
+
+    def _cache_get(self, key: tuple) -> str | None:
+        """Return the cached response for key, marking it recently used."""
+        content = self._cache.pop(key, None)
+        if content is not None:
+            # Reinsert so dict order runs from least to most recently used
+            self._cache[key] = content
+        return content
+
+    def _finish(self, response: Any, model: str, key: tuple | None) -> str:
+        """Extract the response text and cache it if key is given."""
+        content = response.choices[0].message.content
+        if not content:
+            raise LLMEmptyResponseError(model)
+
+        if key is not None:
+            if len(self._cache) >= _CACHE_SIZE:
+                del self._cache[next(iter(self._cache))]
+            self._cache[key] = content
+        return content
+
+    def cache_clear(self) -> None:
+        """Forget all cached responses."""
+        self._cache.clear()
 
     def chat(self, system_prompt: str, user_message: str) -> str:
         """
@@ -1,11 +1,17 @@
 """Tests for the agent examples module."""
 
 import json
+from collections.abc import Mapping
+from unittest.mock import AsyncMock, patch
+
+import pytest
 
 from ..ai_agent.agent_examples import (
+    arun_examples,
     code_spec,
     code_spec_messages,
     csr_message,
+    demonstrate_conversation_memory,
     exercise_1,
     messages,
 )
@@ -16,7 +22,7 @@ class TestAgentMessages:
 
     def test_messages_structure(self):
         """Test the structure of the main messages list."""
-        assert isinstance(messages, list)
+        assert isinstance(messages, tuple)
         assert len(messages) == 2
 
         # Check system message
@@ -26,18 +32,21 @@ class TestAgentMessages:
 
         # Check user message
         assert messages[1]["role"] == "user"
-        assert "swap the keys" in messages[1]["content"]
+        assert "swap the keys and values" in messages[1]["content"]
         assert "dictionary" in messages[1]["content"]
 
     def test_csr_message_structure(self):
         """Test the structure of the CSR message list."""
-        assert isinstance(csr_message, list)
+        assert isinstance(csr_message, tuple)
         assert len(csr_message) == 2
 
         # Check system message
         assert csr_message[0]["role"] == "system"
-        assert "customer service" in csr_message[0]["content"]
-        assert "turn their computer" in csr_message[0]["content"]
+        assert "customer service representative" in csr_message[0]["content"]
+        assert (
+            "is to tell them to turn their computer"
+            in csr_message[0]["content"]
+        )
 
         # Check user message
         assert csr_message[1]["role"] == "user"
@@ -45,17 +54,28 @@ class TestAgentMessages:
 
     def test_exercise_1_structure(self):
         """Test the structure of exercise_1 message list."""
-        assert isinstance(exercise_1, list)
+        assert isinstance(exercise_1, tuple)
         assert len(exercise_1) == 2
 
         # Check system message
         assert exercise_1[0]["role"] == "system"
-        assert "Base64 encoding" in exercise_1[0]["content"]
+        assert "only responds in Base64 encoding" in exercise_1[0]["content"]
 
         # Check user message
         assert exercise_1[1]["role"] == "user"
         assert "capital of the state of AZ" in exercise_1[1]["content"]
 
+    def test_message_lists_are_read_only(self):
+        """Test that the shared example messages cannot be modified."""
+        for message_list in (
+            messages,
+            csr_message,
+            exercise_1,
+            code_spec_messages,
+        ):
+            with pytest.raises(TypeError):
+                message_list[0]["content"] = "changed"
+
     def test_code_spec_structure(self):
         """Test the structure of the code specification."""
         assert isinstance(code_spec, dict)
@@ -70,13 +90,13 @@ class TestAgentMessages:
 
     def test_code_spec_messages_structure(self):
         """Test the structure of code_spec_messages."""
-        assert isinstance(code_spec_messages, list)
+        assert isinstance(code_spec_messages, tuple)
         assert len(code_spec_messages) == 2
 
         # Check system message
         assert code_spec_messages[0]["role"] == "system"
         assert "expert software engineer" in code_spec_messages[0]["content"]
-        assert "functional code" in code_spec_messages[0]["content"]
+        assert "clean functional code" in code_spec_messages[0]["content"]
 
         # Check user message
         assert code_spec_messages[1]["role"] == "user"
@@ -101,11 +121,11 @@ class TestAgentIntegration:
         ]
 
         for message_list in all_message_lists:
-            assert isinstance(message_list, list)
+            assert isinstance(message_list, tuple)
             assert len(message_list) >= 1
 
             for message in message_list:
-                assert isinstance(message, dict)
+                assert isinstance(message, Mapping)
                 assert "role" in message
                 assert "content" in message
                 assert message["role"] in ["system", "user", "assistant"]
@@ -174,3 +194,63 @@ class TestAgentIntegration:
             assert isinstance(param_desc, str)
             assert len(param_name) > 0
             assert len(param_desc) > 0
+
+    @patch("lessons.lab_0004_ai_agent.ai_agent.agent_examples.llm_client")
+    def test_conversation_memory_extends_original_messages(
+        self, mock_llm_client
+    ):
+        """Test that the follow-up conversation starts with messages."""
+        mock_llm_client.generate_response.side_effect = [
+            "def swap(d): ...",
+            "Documented version",
+        ]
+
+        result = demonstrate_conversation_memory()
+
+        assert result == "Documented version"
+        first_call, second_call = (
+            call.args[0]
+            for call in mock_llm_client.generate_response.call_args_list
+        )
+        assert first_call is messages
+        assert tuple(second_call[: len(messages)]) == messages
+        assert second_call[len(messages)] == {
+            "role": "assistant",
+            "content": "def swap(d): ...",
+        }
+        assert second_call[-1]["role"] == "user"
+        assert "documentation" in second_call[-1]["content"]
+        assert len(messages) == 2
+
+    @patch("lessons.lab_0004_ai_agent.ai_agent.agent_examples.llm_client")
+    @pytest.mark.asyncio
+    async def test_arun_examples(self, mock_llm_client, capsys):
+        """Test that arun_examples sends each request once, concurrently."""
+        # Keyed by identity: the frozen message tuples are not hashable
+        replies = {
+            id(messages): "engineer reply",
+            id(csr_message): "csr reply",
+            id(exercise_1): "base64 reply",
+            id(code_spec_messages): "code spec reply",
+        }
+
+        async def agenerate_response(message_list):
+            return replies.get(id(message_list), "memory reply")
+
+        mock_llm_client.agenerate_response = AsyncMock(
+            side_effect=agenerate_response
+        )
+
+        await arun_examples()
+
+        calls = mock_llm_client.agenerate_response.call_args_list
+        # 4 independent requests plus the follow-up; messages is not
+        # requested a second time for the memory example
+        assert len(calls) == 5
+        assert calls[-1].args[0][len(messages)]["content"] == "engineer reply"
+        mock_llm_client.generate_response.assert_not_called()
+
+        output = capsys.readouterr().out
+        for reply in (*replies.values(), "memory reply"):
+            assert reply in output
+        assert output.index("engineer reply") < output.index("memory reply")
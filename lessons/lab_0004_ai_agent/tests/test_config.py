@@ -1,13 +1,12 @@
 """Tests for the configuration module."""
 
 import os
-import tempfile
 from unittest.mock import patch
 
 import pytest
 from dotenv import load_dotenv
 
-from ..ai_agent.config import Config
+from ..ai_agent.config import Config, get_config
 
 
 class TestConfig:
@@ -19,7 +18,7 @@ class TestConfig:
         with patch(
             "lessons.lab_0004_ai_agent.ai_agent.config.load_dotenv"
         ) as mock_load_dotenv:
-            Config()
+            _ = Config().default_model
             mock_load_dotenv.assert_called_once_with()
 
     def test_init_with_custom_env_file(self):
@@ -28,7 +27,7 @@ class TestConfig:
         with patch(
             "lessons.lab_0004_ai_agent.ai_agent.config.load_dotenv"
         ) as mock_load_dotenv:
-            Config(env_file=custom_env_file)
+            _ = Config(env_file=custom_env_file).default_model
             mock_load_dotenv.assert_called_once_with(custom_env_file)
 
     def test_init_with_none_env_file(self):
@@ -36,7 +35,20 @@ class TestConfig:
         with patch(
             "lessons.lab_0004_ai_agent.ai_agent.config.load_dotenv"
         ) as mock_load_dotenv:
-            Config(env_file=None)
+            _ = Config(env_file=None).default_model
+            mock_load_dotenv.assert_called_once_with()
+
+    def test_init_does_not_load_env_file(self):
+        """Test that the .env file is only loaded once a setting is read."""
+        with patch(
+            "lessons.lab_0004_ai_agent.ai_agent.config.load_dotenv"
+        ) as mock_load_dotenv:
+            config = Config()
+            mock_load_dotenv.assert_not_called()
+
+            _ = config.default_model
+            _ = config.default_max_tokens
+            _ = config.default_temperature
             mock_load_dotenv.assert_called_once_with()
 
     def test_openai_api_key_from_env_file(self):
@@ -168,12 +180,113 @@ class TestConfig:
         assert config.default_max_tokens == 512
         assert config.default_temperature == 0.3
 
+    def test_settings_are_cached_after_first_access(self):
+        """Test that settings are read from the environment only once."""
+        with patch.dict(
+            os.environ,
+            {
+                "OPENAI_MODEL": "openai/gpt-3.5-turbo",
+                "OPENAI_MAX_TOKENS": "512",
+            },
+        ):
+            config = Config()
+            assert config.default_model == "openai/gpt-3.5-turbo"
+            assert config.default_max_tokens == 512
+
+            os.environ["OPENAI_MODEL"] = "openai/gpt-4o-mini"
+            os.environ["OPENAI_MAX_TOKENS"] = "2048"
+
+            assert config.default_model == "openai/gpt-3.5-turbo"
+            assert config.default_max_tokens == 512
+
+    def test_reload_reads_environment_again(self):
+        """Test that reload() drops cached settings and reloads .env."""
+        with (
+            patch.dict(os.environ, {"OPENAI_MODEL": "openai/gpt-3.5-turbo"}),
+            patch(
+                "lessons.lab_0004_ai_agent.ai_agent.config.load_dotenv"
+            ) as mock_load_dotenv,
+        ):
+            config = Config()
+            assert config.default_model == "openai/gpt-3.5-turbo"
+
+            os.environ["OPENAI_MODEL"] = "openai/gpt-4o-mini"
+            config.reload()
+
+            assert config.default_model == "openai/gpt-4o-mini"
+            assert mock_load_dotenv.call_count == 2
+
+    def test_reload_does_not_override_loaded_env_file(self, tmp_path):
+        """Test that reload() keeps values already loaded from .env."""
+        env_path = tmp_path / ".env"
+        env_path.write_text("OPENAI_MODEL=openai/gpt-3.5-turbo\n")
+
+        with patch.dict(os.environ, {}, clear=True):
+            config = Config(env_file=str(env_path))
+            assert config.default_model == "openai/gpt-3.5-turbo"
+
+            env_path.write_text("OPENAI_MODEL=openai/gpt-4o-mini\n")
+            config.reload()
+
+            assert config.default_model == "openai/gpt-3.5-turbo"
+
+    def test_reload_before_first_access(self):
+        """Test that reload() is safe before any setting was read."""
+        config = Config()
+        config.reload()
+        assert isinstance(config.default_max_tokens, int)
+
+    def test_missing_api_key_is_not_cached(self):
+        """Test that a missing API key is looked up again on next access."""
+        with (
+            patch.dict(os.environ, {}, clear=True),
+            patch("lessons.lab_0004_ai_agent.ai_agent.config.load_dotenv"),
+        ):
+            config = Config()
+            with pytest.raises(ValueError):
+                _ = config.openai_api_key
+
+            os.environ["OPENAI_API_KEY"] = "late-key"
+            assert config.openai_api_key == "late-key"
+
     def test_global_config_instance(self):
         """Test that global config instance is created."""
         from ..ai_agent.config import config
 
         assert isinstance(config, Config)
 
+    def test_global_config_is_shared_default(self):
+        """Test that the global config is the one get_config() returns."""
+        from ..ai_agent.config import config
+
+        assert get_config() is config
+
+    def test_get_config_reuses_instance_per_env_file(self, tmp_path):
+        """Test that get_config() builds one Config per env_file."""
+        first = str(tmp_path / "first.env")
+        second = str(tmp_path / "second.env")
+
+        assert get_config(first) is get_config(first)
+        assert get_config(first) is not get_config(second)
+        assert get_config(first) is not get_config()
+
+    def test_get_config_default_spellings_share_instance(self):
+        """Test that every way of passing no env_file gives one Config."""
+        from ..ai_agent.config import config
+
+        assert get_config(None) is get_config() is get_config(env_file=None)
+        assert get_config(None) is config
+
+    def test_get_config_loads_env_file_once(self, tmp_path):
+        """Test that repeated get_config() calls parse .env only once."""
+        env_file = str(tmp_path / ".env")
+        with patch(
+            "lessons.lab_0004_ai_agent.ai_agent.config.load_dotenv"
+        ) as mock_load_dotenv:
+            for _ in range(3):
+                _ = get_config(env_file).default_model
+            mock_load_dotenv.assert_called_once_with(env_file)
+
     def test_global_config_with_real_env(self):
         """Test that global config instance works with real .env file."""
         # Load the actual .env file from project root
@@ -250,87 +363,75 @@ class TestConfigIntegration:
         else:
             pytest.skip("No .env file found in project root")
 
-    def test_config_with_temp_env_file(self):
+    def test_config_with_temp_env_file(self, tmp_path):
         """Test Config with a temporary .env file."""
         env_content = """OPENAI_API_KEY=temp-test-key
 OPENAI_MODEL=openai/gpt-3.5-turbo
 OPENAI_MAX_TOKENS=256
 OPENAI_TEMPERATURE=0.8
 """
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".env", delete=False
-        ) as f:
-            f.write(env_content)
-            f.flush()
+        env_path = tmp_path / ".env"
+        env_path.write_text(env_content)
 
-            try:
-                with (
-                    patch.dict(os.environ, {}, clear=True),
-                    patch(
-                        "lessons.lab_0004_ai_agent.ai_agent.config.load_dotenv"
-                    ) as mock_load_dotenv,
-                ):
-                    # Mock load_dotenv to load our test content
-                    def mock_load_dotenv_side_effect(env_file=None):
-                        if env_file == f.name:
-                            # Simulate loading the temp file
-                            os.environ.update(
-                                {
-                                    "OPENAI_API_KEY": "temp-test-key",
-                                    "OPENAI_MODEL": "openai/gpt-3.5-turbo",
-                                    "OPENAI_MAX_TOKENS": "256",
-                                    "OPENAI_TEMPERATURE": "0.8",
-                                }
-                            )
-
-                    mock_load_dotenv.side_effect = mock_load_dotenv_side_effect
-                    config = Config(env_file=f.name)
-                    assert config.openai_api_key == "temp-test-key"
-                    assert config.default_model == "openai/gpt-3.5-turbo"
-                    assert config.default_max_tokens == 256
-                    assert config.default_temperature == 0.8
-            finally:
-                os.unlink(f.name)
-
-    def test_config_with_malformed_env_file(self):
+        with (
+            patch.dict(os.environ, {}, clear=True),
+            patch(
+                "lessons.lab_0004_ai_agent.ai_agent.config.load_dotenv"
+            ) as mock_load_dotenv,
+        ):
+            # Mock load_dotenv to load our test content
+            def mock_load_dotenv_side_effect(env_file=None):
+                if env_file == str(env_path):
+                    # Simulate loading the temp file
+                    os.environ.update(
+                        {
+                            "OPENAI_API_KEY": "temp-test-key",
+                            "OPENAI_MODEL": "openai/gpt-3.5-turbo",
+                            "OPENAI_MAX_TOKENS": "256",
+                            "OPENAI_TEMPERATURE": "0.8",
+                        }
+                    )
+
+            mock_load_dotenv.side_effect = mock_load_dotenv_side_effect
+            config = Config(env_file=str(env_path))
+            assert config.openai_api_key == "temp-test-key"
+            assert config.default_model == "openai/gpt-3.5-turbo"
+            assert config.default_max_tokens == 256
+            assert config.default_temperature == 0.8
+
+    def test_config_with_malformed_env_file(self, tmp_path):
         """Test Config with malformed .env file."""
         env_content = """OPENAI_API_KEY=test-key
 OPENAI_MAX_TOKENS=not-a-number
 OPENAI_TEMPERATURE=also-not-a-number
 """
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".env", delete=False
-        ) as f:
-            f.write(env_content)
-            f.flush()
+        env_path = tmp_path / ".env"
+        env_path.write_text(env_content)
 
-            try:
-                with (
-                    patch.dict(os.environ, {}, clear=True),
-                    patch(
-                        "lessons.lab_0004_ai_agent.ai_agent.config.load_dotenv"
-                    ) as mock_load_dotenv,
-                ):
-                    # Mock load_dotenv to load our test content
-                    def mock_load_dotenv_side_effect(env_file=None):
-                        if env_file == f.name:
-                            # Simulate loading the temp file
-                            os.environ.update(
-                                {
-                                    "OPENAI_API_KEY": "test-key",
-                                    "OPENAI_MAX_TOKENS": "not-a-number",
-                                    "OPENAI_TEMPERATURE": "also-not-a-number",
-                                }
-                            )
-
-                    mock_load_dotenv.side_effect = mock_load_dotenv_side_effect
-                    config = Config(env_file=f.name)
-                    # API key should work
-                    assert config.openai_api_key == "test-key"
-                    # But max_tokens and temperature should raise ValueError
-                    with pytest.raises(ValueError):
-                        _ = config.default_max_tokens
-                    with pytest.raises(ValueError):
-                        _ = config.default_temperature
-            finally:
-                os.unlink(f.name)
+        with (
+            patch.dict(os.environ, {}, clear=True),
+            patch(
+                "lessons.lab_0004_ai_agent.ai_agent.config.load_dotenv"
+            ) as mock_load_dotenv,
+        ):
+            # Mock load_dotenv to load our test content
+            def mock_load_dotenv_side_effect(env_file=None):
+                if env_file == str(env_path):
+                    # Simulate loading the temp file
+                    os.environ.update(
+                        {
+                            "OPENAI_API_KEY": "test-key",
+                            "OPENAI_MAX_TOKENS": "not-a-number",
+                            "OPENAI_TEMPERATURE": "also-not-a-number",
+                        }
+                    )
+
+            mock_load_dotenv.side_effect = mock_load_dotenv_side_effect
+            config = Config(env_file=str(env_path))
+            # API key should work
+            assert config.openai_api_key == "test-key"
+            # But max_tokens and temperature should raise ValueError
+            with pytest.raises(ValueError):
+                _ = config.default_max_tokens
+            with pytest.raises(ValueError):
+                _ = config.default_temperature
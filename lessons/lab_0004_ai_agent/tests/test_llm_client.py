@@ -1,10 +1,14 @@
 """Tests for the LLM client module."""
 
-from unittest.mock import MagicMock, patch
+import os
+import sys
+from types import MappingProxyType
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from ..ai_agent.llm_client import LLMClient
+from ..ai_agent.config import Config
+from ..ai_agent.llm_client import LLMClient, LLMEmptyResponseError
 
 
 class TestLLMClient:
@@ -51,6 +55,32 @@ class TestLLMClient:
         assert client.max_tokens == 1024  # Uses default
         assert client.temperature == 0.7  # Uses default
 
+    @patch("lessons.lab_0004_ai_agent.ai_agent.llm_client.config", object())
+    def test_init_does_not_read_config(self):
+        """Test that defaults are only looked up when first needed."""
+        # Any attribute access on the bare object() would raise
+        client = LLMClient(cache=True)
+
+        assert client.cache is True
+
+    @patch("lessons.lab_0004_ai_agent.ai_agent.llm_client.config")
+    def test_defaults_follow_config_until_set(self, mock_config):
+        """Test that unset values track config and explicit zeros stick."""
+        mock_config.default_model = "openai/gpt-4o"
+        mock_config.default_max_tokens = 1024
+        mock_config.default_temperature = 0.7
+
+        client = LLMClient(temperature=0.0)
+        mock_config.default_model = "openai/gpt-4o-mini"
+
+        assert client.model == "openai/gpt-4o-mini"
+        assert client.max_tokens == 1024
+        assert client.temperature == 0.0
+
+        client.update_settings(max_tokens=256)
+        mock_config.default_max_tokens = 2048
+        assert client.max_tokens == 256
+
     @patch("lessons.lab_0004_ai_agent.ai_agent.llm_client.completion")
     @patch("lessons.lab_0004_ai_agent.ai_agent.llm_client.config")
     def test_generate_response_success(self, mock_config, mock_completion):
@@ -111,6 +141,60 @@ class TestLLMClient:
             temperature=0.5,
         )
 
+    def test_generate_response_loads_env_with_explicit_settings(
+        self, tmp_path
+    ):
+        """Test that .env is loaded even when no setting comes from config."""
+        env_path = tmp_path / ".env"
+        env_path.write_text("OPENAI_API_KEY=sk-from-dotenv\n")
+        seen_keys = []
+
+        def fake_completion(**kwargs):
+            seen_keys.append(os.environ.get("OPENAI_API_KEY"))
+            response = MagicMock()
+            response.choices[0].message.content = "ok"
+            return response
+
+        with (
+            patch.dict(os.environ, {}, clear=True),
+            patch(
+                "lessons.lab_0004_ai_agent.ai_agent.llm_client.config",
+                Config(env_file=str(env_path)),
+            ),
+            patch(
+                "lessons.lab_0004_ai_agent.ai_agent.llm_client.completion",
+                fake_completion,
+            ),
+        ):
+            client = LLMClient(
+                model="openai/gpt-4o", max_tokens=50, temperature=0.2
+            )
+            client.generate_response([{"role": "user", "content": "Hi"}])
+
+        assert seen_keys == ["sk-from-dotenv"]
+
+    @patch("lessons.lab_0004_ai_agent.ai_agent.llm_client.completion")
+    @patch("lessons.lab_0004_ai_agent.ai_agent.llm_client.config")
+    def test_generate_response_with_frozen_messages(
+        self, mock_config, mock_completion
+    ):
+        """Test that read-only messages reach the API as plain dicts."""
+        mock_config.default_model = "openai/gpt-4o"
+        mock_config.default_max_tokens = 1024
+        mock_config.default_temperature = 0.7
+
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "Test response"
+        mock_completion.return_value = mock_response
+
+        messages = (MappingProxyType({"role": "user", "content": "Hi"}),)
+        LLMClient().generate_response(messages)
+
+        sent = mock_completion.call_args.kwargs["messages"]
+        assert sent == [{"role": "user", "content": "Hi"}]
+        assert type(sent[0]) is dict
+
     @patch("lessons.lab_0004_ai_agent.ai_agent.llm_client.completion")
     @patch("lessons.lab_0004_ai_agent.ai_agent.llm_client.config")
     def test_generate_response_api_error(self, mock_config, mock_completion):
@@ -119,15 +203,40 @@ class TestLLMClient:
         mock_config.default_max_tokens = 1024
         mock_config.default_temperature = 0.7
 
-        mock_completion.side_effect = Exception("API Error")
+        api_error = ConnectionError("API Error")
+        mock_completion.side_effect = api_error
 
         client = LLMClient()
         messages = [{"role": "user", "content": "Test"}]
 
-        with pytest.raises(Exception) as exc_info:
+        # The API's own exception reaches the caller unwrapped
+        with pytest.raises(ConnectionError) as exc_info:
             client.generate_response(messages)
 
-        assert "Failed to generate response: API Error" in str(exc_info.value)
+        assert exc_info.value is api_error
+
+    @patch("lessons.lab_0004_ai_agent.ai_agent.llm_client.completion")
+    @patch("lessons.lab_0004_ai_agent.ai_agent.llm_client.config")
+    def test_generate_response_empty_content(
+        self, mock_config, mock_completion
+    ):
+        """Test that a response without content raises a specific error."""
+        mock_config.default_model = "openai/gpt-4o"
+        mock_config.default_max_tokens = 1024
+        mock_config.default_temperature = 0.7
+
+        for content in (None, ""):
+            mock_response = MagicMock()
+            mock_response.choices = [MagicMock()]
+            mock_response.choices[0].message.content = content
+            mock_completion.return_value = mock_response
+
+            client = LLMClient()
+            with pytest.raises(LLMEmptyResponseError) as exc_info:
+                client.generate_response([{"role": "user", "content": "Hi"}])
+
+            assert exc_info.value.model == "openai/gpt-4o"
+            assert "openai/gpt-4o" in str(exc_info.value)
 
     @patch("lessons.lab_0004_ai_agent.ai_agent.llm_client.completion")
     @patch("lessons.lab_0004_ai_agent.ai_agent.llm_client.config")
@@ -208,6 +317,186 @@ class TestLLMClient:
         assert client.max_tokens == original_max_tokens
         assert client.temperature == original_temperature
 
+    @patch("lessons.lab_0004_ai_agent.ai_agent.llm_client.completion")
+    @patch("lessons.lab_0004_ai_agent.ai_agent.llm_client.config")
+    def test_generate_response_cache(self, mock_config, mock_completion):
+        """Test that identical requests are served from the cache."""
+        mock_config.default_model = "openai/gpt-4o"
+        mock_config.default_max_tokens = 1024
+        mock_config.default_temperature = 0.7
+
+        mock_completion.side_effect = [
+            MagicMock(choices=[MagicMock(message=MagicMock(content=text))])
+            for text in ("First", "Second", "Third")
+        ]
+
+        client = LLMClient(cache=True)
+        messages = [{"role": "user", "content": "Test"}]
+
+        assert client.generate_response(messages) == "First"
+        assert client.generate_response(list(messages)) == "First"
+        assert mock_completion.call_count == 1
+
+        # Different settings are a different request
+        client.update_settings(temperature=0.0)
+        assert client.generate_response(messages) == "Second"
+
+        client.cache_clear()
+        assert client.generate_response(messages) == "Third"
+        assert mock_completion.call_count == 3
+
+    @patch("lessons.lab_0004_ai_agent.ai_agent.llm_client._CACHE_SIZE", 2)
+    @patch("lessons.lab_0004_ai_agent.ai_agent.llm_client.completion")
+    @patch("lessons.lab_0004_ai_agent.ai_agent.llm_client.config")
+    def test_generate_response_cache_evicts_least_recently_used(
+        self, mock_config, mock_completion
+    ):
+        """Test that a cache hit keeps an entry from being evicted."""
+        mock_config.default_model = "openai/gpt-4o"
+        mock_config.default_max_tokens = 1024
+        mock_config.default_temperature = 0.7
+        mock_completion.side_effect = lambda **kwargs: MagicMock(
+            choices=[
+                MagicMock(
+                    message=MagicMock(content=kwargs["messages"][0]["content"])
+                )
+            ]
+        )
+
+        client = LLMClient(cache=True)
+        a, b, c = ([{"role": "user", "content": text}] for text in "abc")
+
+        client.generate_response(a)
+        client.generate_response(b)
+        client.generate_response(a)  # Hit: a becomes most recently used
+        client.generate_response(c)  # Full: evicts b, not a
+        assert mock_completion.call_count == 3
+
+        client.generate_response(a)
+        assert mock_completion.call_count == 3
+        client.generate_response(b)
+        assert mock_completion.call_count == 4
+
+    @patch("lessons.lab_0004_ai_agent.ai_agent.llm_client.completion")
+    @patch("lessons.lab_0004_ai_agent.ai_agent.llm_client.config")
+    def test_generate_response_cache_keys_on_all_message_fields(
+        self, mock_config, mock_completion
+    ):
+        """Test that messages differing only in extra fields do not collide."""
+        mock_config.default_model = "openai/gpt-4o"
+        mock_config.default_max_tokens = 1024
+        mock_config.default_temperature = 0.7
+        mock_completion.side_effect = [
+            MagicMock(choices=[MagicMock(message=MagicMock(content=text))])
+            for text in ("For Ann", "For Bob")
+        ]
+
+        client = LLMClient(cache=True)
+        ann = [{"role": "user", "content": "Hi", "name": "ann"}]
+        bob = [{"role": "user", "content": "Hi", "name": "bob"}]
+
+        assert client.generate_response(ann) == "For Ann"
+        assert client.generate_response(bob) == "For Bob"
+        assert mock_completion.call_count == 2
+
+    @patch("lessons.lab_0004_ai_agent.ai_agent.llm_client.completion")
+    @patch("lessons.lab_0004_ai_agent.ai_agent.llm_client.config")
+    def test_generate_response_not_cached_by_default(
+        self, mock_config, mock_completion
+    ):
+        """Test that every request calls the model unless caching is on."""
+        mock_config.default_model = "openai/gpt-4o"
+        mock_config.default_max_tokens = 1024
+        mock_config.default_temperature = 0.7
+
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "Test response"
+        mock_completion.return_value = mock_response
+
+        client = LLMClient()
+        messages = [{"role": "user", "content": "Test"}]
+        client.generate_response(messages)
+        client.generate_response(messages)
+
+        assert mock_completion.call_count == 2
+
+    @patch("lessons.lab_0004_ai_agent.ai_agent.llm_client.completion", None)
+    @patch("lessons.lab_0004_ai_agent.ai_agent.llm_client.config")
+    def test_generate_response_imports_litellm_on_first_use(self, mock_config):
+        """Test that litellm is only imported when a response is needed."""
+        mock_config.default_model = "openai/gpt-4o"
+        mock_config.default_max_tokens = 1024
+        mock_config.default_temperature = 0.7
+
+        llm_client_module = sys.modules[LLMClient.__module__]
+        fake_litellm = MagicMock()
+        fake_litellm.completion.return_value = MagicMock(
+            choices=[MagicMock(message=MagicMock(content="Lazy response"))]
+        )
+
+        client = LLMClient()
+        assert llm_client_module.completion is None
+
+        with patch.dict(sys.modules, {"litellm": fake_litellm}):
+            result = client.generate_response(
+                [{"role": "user", "content": "Test"}]
+            )
+
+        assert result == "Lazy response"
+        assert llm_client_module.completion is fake_litellm.completion
+
+    @patch(
+        "lessons.lab_0004_ai_agent.ai_agent.llm_client.acompletion",
+        new_callable=AsyncMock,
+    )
+    @patch("lessons.lab_0004_ai_agent.ai_agent.llm_client.config")
+    @pytest.mark.asyncio
+    async def test_agenerate_response(self, mock_config, mock_acompletion):
+        """Test asynchronous response generation."""
+        mock_config.default_model = "openai/gpt-4o"
+        mock_config.default_max_tokens = 1024
+        mock_config.default_temperature = 0.7
+
+        mock_acompletion.return_value = MagicMock(
+            choices=[MagicMock(message=MagicMock(content="Async reply"))]
+        )
+
+        client = LLMClient(cache=True)
+        messages = [{"role": "user", "content": "Hello!"}]
+
+        assert await client.agenerate_response(messages) == "Async reply"
+        # Cached responses are shared with the synchronous method
+        assert client.generate_response(messages) == "Async reply"
+        mock_acompletion.assert_awaited_once_with(
+            model="openai/gpt-4o",
+            messages=messages,
+            max_tokens=1024,
+            temperature=0.7,
+        )
+
+    @patch("lessons.lab_0004_ai_agent.ai_agent.llm_client.config")
+    @pytest.mark.asyncio
+    async def test_agenerate_response_loads_env_with_explicit_settings(
+        self, mock_config
+    ):
+        """Test that the async path also loads .env before calling."""
+        with patch(
+            "lessons.lab_0004_ai_agent.ai_agent.llm_client.acompletion",
+            new_callable=AsyncMock,
+        ) as mock_acompletion:
+            mock_acompletion.return_value = MagicMock(
+                choices=[MagicMock(message=MagicMock(content="ok"))]
+            )
+            client = LLMClient(
+                model="openai/gpt-4o", max_tokens=50, temperature=0.2
+            )
+            await client.agenerate_response(
+                [{"role": "user", "content": "Hi"}]
+            )
+
+        mock_config.load.assert_called_once_with()
+
     def test_global_llm_client_instance(self):
         """Test that global llm_client instance is created."""
         from ..ai_agent.llm_client import llm_client
@@ -272,13 +561,10 @@ class TestLLMClientIntegration:
         messages = [{"role": "user", "content": "Test"}]
 
         # First call fails
-        mock_completion.side_effect = Exception("Network error")
+        mock_completion.side_effect = ConnectionError("Network error")
 
-        with pytest.raises(Exception) as exc_info:
+        with pytest.raises(ConnectionError, match="Network error"):
             client.generate_response(messages)
-        assert "Failed to generate response: " "Network error" in str(
-            exc_info.value
-        )
 
         # Second call succeeds
         mock_response = MagicMock()